@@ -1,10 +1,15 @@
 """Read-only SQLite access to Bear's database."""
 
+import itertools
+import os
 import sqlite3
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Optional
 
+from obsidibear.sync_state import content_hash
+
 
 # Core Data epoch offset (2001-01-01 00:00:00 UTC)
 CORE_DATA_EPOCH = 978307200
@@ -22,14 +27,17 @@ BEAR_FILES_PATH = Path.home() / (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class BearAttachment:
     uuid: str
     filename: str
     source_path: Optional[Path] = None
+    # stat of source_path, captured once at fetch time so downstream code
+    # (attachments.py) never has to re-stat the file
+    source_stat: Optional[os.stat_result] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BearNote:
     uuid: str
     title: str
@@ -40,6 +48,47 @@ class BearNote:
     pinned: bool
     tags: List[str] = field(default_factory=list)
     attachments: List[BearAttachment] = field(default_factory=list)
+    # content_hash(text), computed at fetch time while the text is hot so
+    # status/pull/push never re-hash the same note text
+    text_hash: str = ""
+
+
+# (uuid, filename) -> stat for everything under BEAR_FILES_PATH,
+# built by one recursive scandir instead of a stat per attachment row
+_source_stats: Optional[dict] = None
+
+
+def _scan_bear_files() -> dict:
+    """Enumerate Bear's attachment store once per process."""
+    global _source_stats
+    if _source_stats is None:
+        stats = {}
+        try:
+            with os.scandir(BEAR_FILES_PATH) as dirs:
+                for entry in dirs:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    with os.scandir(entry.path) as files:
+                        for f in files:
+                            if f.is_file():
+                                stats[(entry.name, f.name)] = f.stat()
+        except FileNotFoundError:
+            pass
+        _source_stats = stats
+    return _source_stats
+
+
+def _make_attachment(att_uuid: str, filename: str) -> BearAttachment:
+    """Build a BearAttachment from the pre-scanned attachment store."""
+    st = _scan_bear_files().get((att_uuid, filename))
+    if st is None:
+        return BearAttachment(uuid=att_uuid, filename=filename)
+    return BearAttachment(
+        uuid=att_uuid,
+        filename=filename,
+        source_path=BEAR_FILES_PATH / att_uuid / filename,
+        source_stat=st,
+    )
 
 
 def _core_data_to_unix(ts: Optional[float]) -> float:
@@ -56,83 +105,127 @@ def open_bear_db(db_path: Optional[Path] = None) -> sqlite3.Connection:
         raise FileNotFoundError(f"Bear database not found at: {path}")
     uri = f"file:{path}?mode=ro"
     conn = sqlite3.connect(uri, uri=True)
-    conn.row_factory = sqlite3.Row
+    # Tuple rows — sqlite3.Row scans the column names on every lookup.
+    # PRAGMAs size the page cache / mmap window for the joined fetch.
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
-def fetch_all_notes(conn: sqlite3.Connection) -> List[BearNote]:
-    """Fetch all active (non-trashed, non-encrypted) notes from Bear."""
-    cursor = conn.execute("""
-        SELECT
-            Z_PK,
-            ZUNIQUEIDENTIFIER,
-            ZTITLE,
-            ZTEXT,
-            ZCREATIONDATE,
-            ZMODIFICATIONDATE,
-            ZARCHIVED,
-            ZPINNED
-        FROM ZSFNOTE
-        WHERE ZTRASHED = 0
-          AND (ZENCRYPTED = 0 OR ZENCRYPTED IS NULL)
-    """)
+def _ensure_mem_join_tables(conn: sqlite3.Connection):
+    """Copy the join tables into an attached :memory: db with indexes.
 
-    notes_by_pk = {}
-    notes = []
-
-    for row in cursor:
-        note = BearNote(
-            uuid=row["ZUNIQUEIDENTIFIER"],
-            title=row["ZTITLE"] or "Untitled",
-            text=row["ZTEXT"] or "",
-            created=_core_data_to_unix(row["ZCREATIONDATE"]),
-            modified=_core_data_to_unix(row["ZMODIFICATIONDATE"]),
-            archived=bool(row["ZARCHIVED"]),
-            pinned=bool(row["ZPINNED"]),
-        )
-        notes_by_pk[row["Z_PK"]] = note
-        notes.append(note)
-
-    # Fetch tags via join table
-    tag_cursor = conn.execute("""
-        SELECT jt.Z_5NOTES AS note_pk, t.ZTITLE AS tag_title
-        FROM Z_5TAGS jt
-        JOIN ZSFNOTETAG t ON jt.Z_13TAGS = t.Z_PK
+    Bear's schema carries no indexes tuned for our read pattern, and the
+    main DB is opened read-only so we cannot add any there. A one-time
+    indexed copy lets the planner do indexed lookups for the note joins.
+    """
+    try:
+        conn.execute("ATTACH DATABASE ':memory:' AS mem")
+    except sqlite3.OperationalError:
+        return  # already attached on this connection
+    conn.execute("""
+        CREATE TABLE mem.tag_map AS
+        SELECT Z_5NOTES, Z_13TAGS FROM Z_5TAGS
     """)
-    for row in tag_cursor:
-        note = notes_by_pk.get(row["note_pk"])
-        if note:
-            note.tags.append(row["tag_title"])
-
-    # Deduplicate tags (keep unique, preserve order)
-    for note in notes:
-        seen = set()
-        deduped = []
-        for tag in note.tags:
-            if tag not in seen:
-                seen.add(tag)
-                deduped.append(tag)
-        note.tags = deduped
-
-    # Fetch attachments
-    att_cursor = conn.execute("""
+    conn.execute("CREATE INDEX mem.ix_tag_map_note ON tag_map(Z_5NOTES)")
+    conn.execute("""
+        CREATE TABLE mem.note_file AS
         SELECT ZNOTE, ZUNIQUEIDENTIFIER, ZFILENAME
         FROM ZSFNOTEFILE
         WHERE ZFILENAME IS NOT NULL
     """)
-    for row in att_cursor:
-        note = notes_by_pk.get(row["ZNOTE"])
-        if note:
-            att_uuid = row["ZUNIQUEIDENTIFIER"]
-            filename = row["ZFILENAME"]
-            source = BEAR_FILES_PATH / att_uuid / filename
-            note.attachments.append(BearAttachment(
-                uuid=att_uuid,
-                filename=filename,
-                source_path=source if source.exists() else None,
-            ))
+    conn.execute("CREATE INDEX mem.ix_note_file_note ON note_file(ZNOTE)")
+
+
+def iter_all_notes(conn: sqlite3.Connection):
+    """Stream all active (non-trashed, non-encrypted) notes from Bear.
+
+    Notes and attachments come from one joined query; tags from a second
+    DISTINCT query. Both are ordered by note primary key, so the two
+    cursors merge in lockstep and peak memory stays at one note, not the
+    whole vault.
+
+    Yields:
+        BearNote, in primary-key order.
+    """
+    _ensure_mem_join_tables(conn)
+
+    cursor = conn.execute("""
+        SELECT
+            n.Z_PK,
+            n.ZUNIQUEIDENTIFIER,
+            n.ZTITLE,
+            n.ZTEXT,
+            n.ZCREATIONDATE,
+            n.ZMODIFICATIONDATE,
+            n.ZARCHIVED,
+            n.ZPINNED,
+            f.ZUNIQUEIDENTIFIER,
+            f.ZFILENAME
+        FROM ZSFNOTE n
+        LEFT JOIN mem.note_file f ON f.ZNOTE = n.Z_PK
+        WHERE n.ZTRASHED = 0
+          AND (n.ZENCRYPTED = 0 OR n.ZENCRYPTED IS NULL)
+        ORDER BY n.Z_PK
+    """)
+    # Batch cursor transport: fetchmany(1024) crosses the C boundary once
+    # per chunk instead of once per row
+    cursor.arraysize = 1024
+    rows = itertools.chain.from_iterable(iter(cursor.fetchmany, []))
+
+    # Tags: SELECT DISTINCT dedupes in SQLite's hash table, ORDER BY lets
+    # groupby hand over each note's tags as one slice
+    tag_cursor = conn.execute("""
+        SELECT DISTINCT jt.Z_5NOTES, t.Z_PK, t.ZTITLE
+        FROM mem.tag_map jt
+        JOIN ZSFNOTETAG t ON t.Z_PK = jt.Z_13TAGS
+        ORDER BY jt.Z_5NOTES, t.Z_PK
+    """)
+    tag_cursor.arraysize = 1024
+    tag_rows = itertools.chain.from_iterable(iter(tag_cursor.fetchmany, []))
+    tag_groups = itertools.groupby(tag_rows, key=itemgetter(0))
+    tag_pk, tgroup = next(tag_groups, (None, None))
+
+    epoch = CORE_DATA_EPOCH
+    # Local bindings for the per-note loop: LOAD_FAST instead of a
+    # global lookup on every note
+    _hash = content_hash
+    _make_att = _make_attachment
+
+    for pk, group in itertools.groupby(rows, key=itemgetter(0)):
+        note = None
+        for row in group:
+            if note is None:
+                text = row[3] or ""
+                note = BearNote(
+                    uuid=row[1],
+                    title=row[2] or "Untitled",
+                    text=text,
+                    created=row[4] + epoch if row[4] is not None else 0.0,
+                    modified=row[5] + epoch if row[5] is not None else 0.0,
+                    archived=bool(row[6]),
+                    pinned=bool(row[7]),
+                    text_hash=_hash(text),
+                )
+            att_uuid = row[8]
+            if att_uuid is not None:
+                note.attachments.append(_make_att(att_uuid, row[9]))
 
-    return notes
+        # Advance the tag stream to this note (skipped pks belong to
+        # trashed/encrypted notes)
+        while tag_pk is not None and tag_pk < pk:
+            tag_pk, tgroup = next(tag_groups, (None, None))
+        if tag_pk == pk:
+            note.tags = [r[2] for r in tgroup]
+            tag_pk, tgroup = next(tag_groups, (None, None))
+
+        yield note
+
+
+def fetch_all_notes(conn: sqlite3.Connection) -> List[BearNote]:
+    """Fetch all active notes as a list (see iter_all_notes)."""
+    return list(iter_all_notes(conn))
 
 
 def fetch_note_by_uuid(conn: sqlite3.Connection, uuid: str) -> Optional[BearNote]:
@@ -157,18 +250,19 @@ def fetch_note_by_uuid(conn: sqlite3.Connection, uuid: str) -> Optional[BearNote
     if not row:
         return None
 
+    pk, note_uuid, title, text, created, modified, archived, pinned = row
+    text = text or ""
     note = BearNote(
-        uuid=row["ZUNIQUEIDENTIFIER"],
-        title=row["ZTITLE"] or "Untitled",
-        text=row["ZTEXT"] or "",
-        created=_core_data_to_unix(row["ZCREATIONDATE"]),
-        modified=_core_data_to_unix(row["ZMODIFICATIONDATE"]),
-        archived=bool(row["ZARCHIVED"]),
-        pinned=bool(row["ZPINNED"]),
+        uuid=note_uuid,
+        title=title or "Untitled",
+        text=text,
+        created=_core_data_to_unix(created),
+        modified=_core_data_to_unix(modified),
+        archived=bool(archived),
+        pinned=bool(pinned),
+        text_hash=content_hash(text),
     )
 
-    pk = row["Z_PK"]
-
     # Tags
     tag_cursor = conn.execute("""
         SELECT t.ZTITLE AS tag_title
@@ -177,8 +271,7 @@ def fetch_note_by_uuid(conn: sqlite3.Connection, uuid: str) -> Optional[BearNote
         WHERE jt.Z_5NOTES = ?
     """, (pk,))
     seen = set()
-    for trow in tag_cursor:
-        tag = trow["tag_title"]
+    for (tag,) in tag_cursor:
         if tag not in seen:
             seen.add(tag)
             note.tags.append(tag)
@@ -189,14 +282,7 @@ def fetch_note_by_uuid(conn: sqlite3.Connection, uuid: str) -> Optional[BearNote
         FROM ZSFNOTEFILE
         WHERE ZNOTE = ? AND ZFILENAME IS NOT NULL
     """, (pk,))
-    for arow in att_cursor:
-        att_uuid = arow["ZUNIQUEIDENTIFIER"]
-        filename = arow["ZFILENAME"]
-        source = BEAR_FILES_PATH / att_uuid / filename
-        note.attachments.append(BearAttachment(
-            uuid=att_uuid,
-            filename=filename,
-            source_path=source if source.exists() else None,
-        ))
+    for att_uuid, filename in att_cursor:
+        note.attachments.append(_make_attachment(att_uuid, filename))
 
     return note
@@ -114,25 +114,37 @@ def cmd_status(args):
     db_path = Path(config.bear_db_path) if config.bear_db_path else None
 
     from obsidibear.bear_db import fetch_all_notes, open_bear_db
-    from obsidibear.sync_state import SyncStateManager, content_hash
+    from obsidibear.sync_state import (
+        SyncStateManager, hash_vault_files, legacy_content_hash,
+    )
 
     conn = open_bear_db(db_path)
     state = SyncStateManager(vault)
 
     try:
         notes = fetch_all_notes(conn)
-        notes_by_id = {n.uuid: n for n in notes}
-
-        bear_hashes = {n.uuid: content_hash(n.text) for n in notes}
-        obs_hashes = {}
-        for bear_id, ns in state.all_notes().items():
-            fp = vault / ns.file_path
-            if fp.exists():
-                obs_hashes[bear_id] = content_hash(
-                    fp.read_text(encoding="utf-8")
-                )
-
-        changes = state.detect_changes(bear_hashes, obs_hashes)
+
+        # One pass over notes for both lookup dicts; hashes were computed
+        # at fetch time
+        notes_by_id = {}
+        bear_hashes = {}
+        for n in notes:
+            notes_by_id[n.uuid] = n
+            bear_hashes[n.uuid] = n.text_hash
+
+        obs_hashes = hash_vault_files(vault, state.all_notes())
+
+        # One-time SHA-256 pass for pre-upgrade state entries (see
+        # legacy_ids); status doesn't save, so the migration itself
+        # persists on the next pull/push
+        legacy_hashes = None
+        if state.legacy_ids:
+            legacy_hashes = {
+                n.uuid: legacy_content_hash(n.text)
+                for n in notes if n.uuid in state.legacy_ids
+            }
+
+        changes = state.detect_changes(bear_hashes, obs_hashes, legacy_hashes)
 
         if not any([
             changes.bear_changed, changes.obsidian_changed,
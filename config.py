@@ -5,6 +5,11 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson  # optional: ~5× faster and writes UTF-8 bytes directly
+except ImportError:
+    orjson = None
+
 
 CONFIG_FILENAME = ".obsidibear.json"
 
@@ -21,7 +26,8 @@ def load_config(vault_path: Path) -> Config:
     """Load config from vault root, creating defaults if missing."""
     config_file = vault_path / CONFIG_FILENAME
     if config_file.exists():
-        data = json.loads(config_file.read_text(encoding="utf-8"))
+        raw = config_file.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         return Config(
             vault_path=vault_path,
             bear_db_path=data.get("bear_db_path"),
@@ -44,7 +50,12 @@ def save_config(config: Config):
     if config.push_delay != 0.5:
         data["push_delay"] = config.push_delay
 
-    config_file.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    if orjson:
+        config_file.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+        )
+    else:
+        config_file.write_text(
+            json.dumps(data, indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
@@ -1,14 +1,19 @@
 """Bear → Obsidian export orchestration."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, List, Optional
 
 from obsidibear.attachments import build_attachment_map, copy_attachments
-from obsidibear.bear_db import BearNote, fetch_all_notes, open_bear_db
+from obsidibear.bear_db import (
+    BearNote, fetch_all_notes, iter_all_notes, open_bear_db,
+)
 from obsidibear.config import Config
 from obsidibear.filenames import FilenameDeduplicator
 from obsidibear.markdown import bear_to_obsidian, extract_primary_tag
-from obsidibear.sync_state import SyncStateManager, content_hash
+from obsidibear.sync_state import (
+    SyncStateManager, content_hash, hash_vault_files, legacy_content_hash,
+)
 
 
 def tag_to_folder(tag: str) -> Path:
@@ -50,33 +55,65 @@ def export_all(
 
     stats = {"notes_exported": 0, "attachments_copied": 0, "errors": []}
 
-    try:
-        notes = fetch_all_notes(conn)
-        log(f"Found {len(notes)} notes in Bear")
-
-        exclude = set(config.exclude_tags)
-
-        for note in notes:
-            # Skip excluded tags
-            if exclude and any(t in exclude for t in note.tags):
-                continue
-
-            try:
-                _export_note(note, vault, state, dedup)
-                stats["notes_exported"] += 1
+    # Shared across notes so each _attachments folder is scanned once
+    dest_stat_cache = {}
 
-                # Copy attachments
-                if note.attachments:
+    try:
+        exclude = frozenset(config.exclude_tags)
+
+        # One resolved+created folder per primary tag, not per note
+        folder_cache = {}
+
+        # File writes go to a small pool so the next note's conversion
+        # overlaps the previous note's disk write
+        write_futures = {}
+        with ThreadPoolExecutor(max_workers=8) as writer:
+            # Stream notes so peak memory is one note, not the vault
+            for note in iter_all_notes(conn):
+                # Skip excluded tags — set intersection runs in C
+                if exclude.intersection(note.tags):
+                    continue
+
+                try:
                     primary_tag = extract_primary_tag(note.text, note.tags)
-                    folder = vault / (tag_to_folder(primary_tag) if primary_tag else Path("_untagged"))
-                    copied = copy_attachments(note.attachments, folder)
-                    stats["attachments_copied"] += copied
-
-                if stats["notes_exported"] % 25 == 0:
-                    log(f"  Exported {stats['notes_exported']} notes...")
-
-            except Exception as e:
-                stats["errors"].append(f"{note.title}: {e}")
+                    folder = folder_cache.get(primary_tag)
+                    if folder is None:
+                        folder = vault / (
+                            tag_to_folder(primary_tag) if primary_tag
+                            else Path("_untagged")
+                        )
+                        folder.mkdir(parents=True, exist_ok=True)
+                        folder_cache[primary_tag] = folder
+
+                    future = _export_note(
+                        note, vault, state, dedup, writer, folder=folder
+                    )
+                    if future is not None:
+                        write_futures[future] = (note.uuid, note.title)
+                    stats["notes_exported"] += 1
+
+                    # Copy attachments
+                    if note.attachments:
+                        copied = copy_attachments(
+                            note.attachments, folder, dest_stat_cache
+                        )
+                        stats["attachments_copied"] += copied
+
+                    if stats["notes_exported"] % 25 == 0:
+                        log(f"  Exported {stats['notes_exported']} notes...")
+
+                except Exception as e:
+                    stats["errors"].append(f"{note.title}: {e}")
+
+        # Pool is drained; surface any write failures and drop their
+        # state entries before saving, so a note whose file never hit
+        # disk stays "new" and is retried on the next run
+        for future, (uuid, title) in write_futures.items():
+            exc = future.exception()
+            if exc is not None:
+                stats["errors"].append(f"{title}: {exc}")
+                state.remove_note(uuid)
+                stats["notes_exported"] -= 1
 
         state.save()
         log(f"Export complete: {stats['notes_exported']} notes, "
@@ -103,16 +140,25 @@ def _export_note(
     vault: Path,
     state: SyncStateManager,
     dedup: FilenameDeduplicator,
-):
-    """Export a single Bear note to the vault."""
-    # Determine folder from primary tag
-    primary_tag = extract_primary_tag(note.text, note.tags)
-    if primary_tag:
-        folder = vault / tag_to_folder(primary_tag)
-    else:
-        folder = vault / "_untagged"
-
-    folder.mkdir(parents=True, exist_ok=True)
+    writer: Optional[ThreadPoolExecutor] = None,
+    folder: Optional[Path] = None,
+) -> Optional[Future]:
+    """Export a single Bear note to the vault.
+
+    With a writer executor the file write is submitted to it (returning
+    the Future) so the caller can overlap conversion of the next note
+    with this note's disk write; otherwise the write happens inline.
+    Pass folder (already created) to skip the per-note tag derivation
+    and mkdir.
+    """
+    if folder is None:
+        # Determine folder from primary tag
+        primary_tag = extract_primary_tag(note.text, note.tags)
+        if primary_tag:
+            folder = vault / tag_to_folder(primary_tag)
+        else:
+            folder = vault / "_untagged"
+        folder.mkdir(parents=True, exist_ok=True)
 
     # Build attachment mapping
     att_map = build_attachment_map(note.attachments, folder)
@@ -128,25 +174,39 @@ def _export_note(
         attachment_map=att_map,
     )
 
-    # Get unique file path
+    # Get unique file path (its parent is folder, created above)
     file_path = dedup.get_unique_path(folder, note.title)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write file
-    file_path.write_text(obsidian_content, encoding="utf-8")
+    # Write file — write_bytes skips write_text's extra encode pass
+    data = obsidian_content.encode("utf-8")
+    if writer is not None:
+        future = writer.submit(file_path.write_bytes, data)
+        # Async write: stat stamp gets filled in lazily on the next
+        # hash pass (hash_vault_files)
+        mtime_ns, size = 0, -1
+    else:
+        file_path.write_bytes(data)
+        st = file_path.stat()
+        mtime_ns, size = st.st_mtime_ns, st.st_size
+        future = None
 
-    # Update sync state
+    # Update sync state; file_path is under vault by construction, so a
+    # slice replaces Path.relative_to
     bear_hash = content_hash(note.text)
     obs_hash = content_hash(obsidian_content)
-    rel_path = str(file_path.relative_to(vault))
+    rel_path = str(file_path)[len(str(vault)) + 1:]
 
     state.set_note(
         bear_id=note.uuid,
         file_path=rel_path,
         bear_hash=bear_hash,
         obsidian_hash=obs_hash,
+        file_mtime_ns=mtime_ns,
+        file_size=size,
     )
 
+    return future
+
 
 def pull_changes(
     config: Config,
@@ -165,93 +225,103 @@ def pull_changes(
     db_path = Path(config.bear_db_path) if config.bear_db_path else None
     conn = open_bear_db(db_path)
     state = SyncStateManager(vault)
-    dedup = FilenameDeduplicator()
 
     stats = {"pulled": 0, "new": 0, "conflicts": 0, "errors": []}
+    dest_stat_cache = {}
 
     try:
         notes = fetch_all_notes(conn)
-        notes_by_id = {n.uuid: n for n in notes}
-        exclude = set(config.exclude_tags)
-
-        # Register existing files in dedup to avoid collisions
-        for ns in state.all_notes().values():
-            p = Path(ns.file_path)
-            dedup.get_unique_path(vault / p.parent, p.stem)
-
-        # Build current hashes
-        bear_hashes = {}
-        obs_hashes = {}
+        exclude = frozenset(config.exclude_tags)
+
+        # Current hashes were computed at fetch time
+        bear_hashes = {
+            n.uuid: n.text_hash
+            for n in notes
+            if not exclude.intersection(n.tags)
+        }
+
+        obs_hashes = hash_vault_files(vault, state.all_notes())
+
+        # One-time SHA-256 pass for pre-upgrade state entries, so edits
+        # pending at upgrade time are still detected (see legacy_ids)
+        legacy_hashes = None
+        if state.legacy_ids:
+            legacy_hashes = {
+                n.uuid: legacy_content_hash(n.text)
+                for n in notes if n.uuid in state.legacy_ids
+            }
+
+        changes = state.detect_changes(bear_hashes, obs_hashes, legacy_hashes)
+
+        new_set = set(changes.new_in_bear)
+        changed_set = set(changes.bear_changed)
+        conflict_set = set(changes.conflicts)
+
+        # Only seed the deduplicator (from tracked on-disk paths) when
+        # there is actually something new to name
+        dedup = None
+        if new_set:
+            dedup = FilenameDeduplicator(
+                (vault / ns.file_path).as_posix()
+                for ns in state.all_notes().values()
+            )
+
+        # One pass over notes dispatches new / changed / conflicting
         for note in notes:
-            if exclude and any(t in exclude for t in note.tags):
+            if exclude.intersection(note.tags):
                 continue
-            bear_hashes[note.uuid] = content_hash(note.text)
 
-        for bear_id, ns in state.all_notes().items():
-            fp = vault / ns.file_path
-            if fp.exists():
-                obs_hashes[bear_id] = content_hash(
-                    fp.read_text(encoding="utf-8")
-                )
-
-        changes = state.detect_changes(bear_hashes, obs_hashes)
-
-        # Handle new notes
-        for bid in changes.new_in_bear:
-            note = notes_by_id.get(bid)
-            if not note:
-                continue
-            if exclude and any(t in exclude for t in note.tags):
-                continue
-            try:
-                _export_note(note, vault, state, dedup)
-                stats["new"] += 1
-            except Exception as e:
-                stats["errors"].append(f"New {note.title}: {e}")
-
-        # Handle Bear-side changes
-        for bid in changes.bear_changed:
-            note = notes_by_id.get(bid)
-            if not note:
-                continue
-            ns = state.get_note(bid)
-            if not ns:
-                continue
-            try:
-                # Re-export to the same file path
-                file_path = vault / ns.file_path
-                att_map = build_attachment_map(note.attachments, file_path.parent)
-                obsidian_content = bear_to_obsidian(
-                    text=note.text,
-                    bear_id=note.uuid,
-                    created=note.created,
-                    modified=note.modified,
-                    archived=note.archived,
-                    pinned=note.pinned,
-                    attachment_map=att_map,
-                )
-                file_path.write_text(obsidian_content, encoding="utf-8")
-
-                state.set_note(
-                    bear_id=note.uuid,
-                    file_path=ns.file_path,
-                    bear_hash=content_hash(note.text),
-                    obsidian_hash=content_hash(obsidian_content),
-                )
-                stats["pulled"] += 1
-
-                if note.attachments:
-                    copy_attachments(note.attachments, file_path.parent)
-
-            except Exception as e:
-                stats["errors"].append(f"Pull {note.title}: {e}")
-
-        # Report conflicts
-        for bid in changes.conflicts:
-            note = notes_by_id.get(bid)
-            title = note.title if note else bid
-            log(f"  CONFLICT: {title} (changed in both Bear and Obsidian)")
-            stats["conflicts"] += 1
+            if note.uuid in new_set:
+                try:
+                    _export_note(note, vault, state, dedup)
+                    stats["new"] += 1
+                except Exception as e:
+                    stats["errors"].append(f"New {note.title}: {e}")
+
+            elif note.uuid in changed_set:
+                ns = state.get_note(note.uuid)
+                if not ns:
+                    continue
+                try:
+                    # Re-export to the same file path
+                    file_path = vault / ns.file_path
+                    att_map = build_attachment_map(
+                        note.attachments, file_path.parent
+                    )
+                    obsidian_content = bear_to_obsidian(
+                        text=note.text,
+                        bear_id=note.uuid,
+                        created=note.created,
+                        modified=note.modified,
+                        archived=note.archived,
+                        pinned=note.pinned,
+                        attachment_map=att_map,
+                    )
+                    file_path.write_text(obsidian_content, encoding="utf-8")
+                    st = file_path.stat()
+
+                    state.set_note(
+                        bear_id=note.uuid,
+                        file_path=ns.file_path,
+                        bear_hash=note.text_hash,
+                        obsidian_hash=content_hash(obsidian_content),
+                        file_mtime_ns=st.st_mtime_ns,
+                        file_size=st.st_size,
+                    )
+                    stats["pulled"] += 1
+
+                    if note.attachments:
+                        copy_attachments(
+                            note.attachments, file_path.parent, dest_stat_cache
+                        )
+
+                except Exception as e:
+                    stats["errors"].append(f"Pull {note.title}: {e}")
+
+            elif note.uuid in conflict_set:
+                log(f"  CONFLICT: {note.title} "
+                    "(changed in both Bear and Obsidian)")
+                stats["conflicts"] += 1
 
         state.save()
         log(f"Pull complete: {stats['pulled']} updated, {stats['new']} new, "
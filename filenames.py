@@ -1,28 +1,33 @@
 """Title sanitization and filename deduplication."""
 
+import functools
 import re
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
 
-# Characters not allowed in filenames on macOS/Windows
-_INVALID_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+# Single pass over the title: a run of two or more invalid/underscore/space
+# characters collapses to one space (matching the old two-pass behavior of
+# replace-invalid-with-underscore then collapse-runs), a lone invalid
+# character becomes an underscore.
+_SANITIZE = re.compile(r'[<>:"/\\|?*\x00-\x1f_ ]{2,}|[<>:"/\\|?*\x00-\x1f]')
 
 # Max filename length (leaving room for extension and dedup suffix)
 _MAX_NAME_LEN = 200
 
 
+def _sanitize_repl(match: re.Match) -> str:
+    return " " if len(match.group()) > 1 else "_"
+
+
+@functools.lru_cache(maxsize=65536)
 def sanitize_title(title: str) -> str:
     """Convert a Bear note title to a safe filename (without extension)."""
     name = title.strip()
     if not name:
         name = "Untitled"
 
-    # Replace invalid characters with underscore
-    name = _INVALID_CHARS.sub("_", name)
-
-    # Collapse multiple underscores/spaces
-    name = re.sub(r"[_ ]{2,}", " ", name)
+    name = _SANITIZE.sub(_sanitize_repl, name)
 
     # Strip leading/trailing dots and spaces
     name = name.strip(". ")
@@ -40,28 +45,36 @@ def sanitize_title(title: str) -> str:
 class FilenameDeduplicator:
     """Tracks used filenames and deduplicates collisions."""
 
-    def __init__(self):
-        self._used: Dict[str, int] = {}  # lowercase path -> count
+    def __init__(self, known_paths: Optional[Iterable[str]] = None):
+        """known_paths: posix-form paths already on disk, reserved as-is
+        (no sanitization — they are existing filenames)."""
+        # casefolded path -> count
+        self._used: Dict[str, int] = (
+            {p.casefold(): 1 for p in known_paths} if known_paths else {}
+        )
 
     def get_unique_path(self, folder: Path, title: str) -> Path:
         """Return a unique .md file path within the given folder."""
         base = sanitize_title(title)
-        candidate = folder / f"{base}.md"
-        key = str(candidate).lower()
+        # Keys are built with f-strings; Path construction happens once,
+        # on the returned value
+        prefix = f"{folder.as_posix()}/{base}".casefold()
+        key = f"{prefix}.md"
 
-        if key not in self._used:
+        counter = self._used.get(key)
+        if counter is None:
             self._used[key] = 1
-            return candidate
-
-        # Deduplicate with numeric suffix
-        self._used[key] += 1
-        n = self._used[key]
-        candidate = folder / f"{base} {n}.md"
-        # Handle the (unlikely) case of cascading collisions
-        new_key = str(candidate).lower()
+            return folder / f"{base}.md"
+
+        # Deduplicate with numeric suffix. The base key stores the last
+        # suffix handed out, so a title colliding k times costs O(k)
+        # total instead of O(k^2) rescans; the loop only advances past
+        # names reserved some other way (e.g. seeded from disk).
+        n = counter + 1
+        new_key = f"{prefix} {n}.md"
         while new_key in self._used:
             n += 1
-            candidate = folder / f"{base} {n}.md"
-            new_key = str(candidate).lower()
+            new_key = f"{prefix} {n}.md"
+        self._used[key] = n
         self._used[new_key] = 1
-        return candidate
+        return folder / f"{base} {n}.md"
@@ -1,5 +1,6 @@
 """Content conversion between Bear and Obsidian markdown formats."""
 
+import functools
 import re
 from datetime import datetime, timezone
 from typing import List, Optional
@@ -8,6 +9,28 @@ from typing import List, Optional
 # Bear uses U+2800 (Braille blank) as empty-line spacers
 _BRAILLE_BLANK = "\u2800"
 
+# bear_id line inside the frontmatter block
+_BEAR_ID_RE = re.compile(r'^bear_id:[ \t]*(\S+)', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1024)
+def _tag_alternation(tags: tuple) -> "re.Pattern":
+    """Alternation over a note's known tags, longest first so nested tags
+    win, with a lookahead so '#work' never matches inside '#work/sub'."""
+    alt = "|".join(
+        re.escape(t) for t in sorted(tags, key=len, reverse=True)
+    )
+    return re.compile(r'(?:^|(?<=\s))#(' + alt + r')(?![\w/\-])')
+
+
+@functools.lru_cache(maxsize=1024)
+def _path_alternation(paths: tuple) -> "re.Pattern":
+    """Alternation of literal attachment paths, longest first so a path
+    that is a prefix of another can't shadow it."""
+    return re.compile("|".join(
+        re.escape(p) for p in sorted(paths, key=len, reverse=True)
+    ))
+
 
 def bear_to_obsidian(
     text: str,
@@ -37,10 +60,12 @@ def bear_to_obsidian(
     # Replace braille blank spacers with empty lines
     content = content.replace(_BRAILLE_BLANK, "")
 
-    # Convert Bear image references to relative Obsidian paths
+    # Convert Bear image references to relative Obsidian paths in one
+    # C-level scan instead of a full replace pass per attachment
     if attachment_map:
-        for bear_path, obsidian_path in attachment_map.items():
-            content = content.replace(bear_path, obsidian_path)
+        content = _path_alternation(tuple(attachment_map)).sub(
+            lambda m: attachment_map[m.group(0)], content
+        )
 
     # Build frontmatter
     frontmatter = _build_frontmatter(bear_id, created, modified, archived, pinned)
@@ -55,42 +80,49 @@ def obsidian_to_bear(text: str, attachment_map: Optional[dict] = None) -> str:
     """
     content = strip_frontmatter(text)
 
-    # Reverse image path conversion
+    # Reverse image path conversion with the same single-scan approach
     if attachment_map:
-        for obsidian_path, bear_path in attachment_map.items():
-            content = content.replace(obsidian_path, bear_path)
+        content = _path_alternation(tuple(attachment_map)).sub(
+            lambda m: attachment_map[m.group(0)], content
+        )
 
     return content
 
 
 def strip_frontmatter(text: str) -> str:
     """Remove YAML frontmatter from markdown text."""
-    if not text.startswith("---\n"):
+    # Slice compare instead of the startswith method dispatch
+    if text[:4] != "---\n":
         return text
 
     end = text.find("\n---\n", 4)
-    if end == -1:
-        return text
-
     # Skip the closing --- and the newline after it
-    return text[end + 5:]
+    return text if end == -1 else text[end + 5:]
+
+
+def strip_frontmatter_bytes(buf: bytes) -> bytes:
+    """Bytes-level strip_frontmatter — find() on bytes uses memmem in C
+    and skips decoding files that are only read to be stripped."""
+    if buf[:4] != b"---\n":
+        return buf
+
+    end = buf.find(b"\n---\n", 4)
+    return buf if end == -1 else buf[end + 5:]
 
 
 def extract_bear_id(text: str) -> Optional[str]:
     """Extract bear_id from YAML frontmatter."""
-    if not text.startswith("---\n"):
+    if text[:4] != "---\n":
         return None
 
     end = text.find("\n---\n", 4)
     if end == -1:
         return None
 
-    frontmatter = text[4:end]
-    for line in frontmatter.split("\n"):
-        if line.startswith("bear_id:"):
-            return line.split(":", 1)[1].strip()
-
-    return None
+    # One precompiled multiline search over the frontmatter slice
+    # instead of a Python-level split + startswith per line
+    match = _BEAR_ID_RE.search(text, 4, end)
+    return match.group(1) if match else None
 
 
 def extract_primary_tag(text: str, tags: List[str]) -> Optional[str]:
@@ -102,22 +134,14 @@ def extract_primary_tag(text: str, tags: List[str]) -> Optional[str]:
     if not tags:
         return None
 
-    # Build a set for fast lookup
-    tag_set = set(tags)
-
-    # Find all #tag references in content (including nested like #area/sub)
-    # Bear tags can contain letters, numbers, /, -, _
-    for match in re.finditer(r'(?:^|(?<=\s))#([\w/\-]+)', text):
-        candidate = match.group(1)
-        if candidate in tag_set:
-            return candidate
-        # Also check if it's a prefix of a nested tag
-        for tag in tags:
-            if tag == candidate:
-                return tag
+    # One alternation search over the known tags: the regex engine
+    # short-circuits in C instead of checking each #token in Python
+    match = _tag_alternation(tuple(tags)).search(text)
+    if match:
+        return match.group(1)
 
     # Fallback: return the first tag from the tags list
-    return tags[0] if tags else None
+    return tags[0]
 
 
 def _build_frontmatter(
@@ -128,17 +152,24 @@ def _build_frontmatter(
     pinned: bool,
 ) -> str:
     """Build YAML frontmatter string."""
-    created_dt = datetime.fromtimestamp(created, tz=timezone.utc)
-    modified_dt = datetime.fromtimestamp(modified, tz=timezone.utc)
-
-    lines = [
-        "---",
-        f"bear_id: {bear_id}",
-        f"created: {created_dt.strftime('%Y-%m-%dT%H:%M:%S')}",
-        f"modified: {modified_dt.strftime('%Y-%m-%dT%H:%M:%S')}",
-        f"archived: {'true' if archived else 'false'}",
-        f"pinned: {'true' if pinned else 'false'}",
-        "---",
-        "",
-    ]
-    return "\n".join(lines)
+    # isoformat emits straight from the datetime's fields, skipping
+    # strftime's format parsing; dropping tzinfo keeps the bare
+    # YYYY-MM-DDTHH:MM:SS form (no +00:00 suffix) strftime produced
+    created_iso = (
+        datetime.fromtimestamp(created, tz=timezone.utc)
+        .replace(tzinfo=None).isoformat(timespec="seconds")
+    )
+    modified_iso = (
+        datetime.fromtimestamp(modified, tz=timezone.utc)
+        .replace(tzinfo=None).isoformat(timespec="seconds")
+    )
+
+    return (
+        f"---\n"
+        f"bear_id: {bear_id}\n"
+        f"created: {created_iso}\n"
+        f"modified: {modified_iso}\n"
+        f"archived: {'true' if archived else 'false'}\n"
+        f"pinned: {'true' if pinned else 'false'}\n"
+        f"---\n"
+    )
@@ -1,5 +1,6 @@
 """Push Obsidian edits back to Bear via x-callback-url."""
 
+import shlex
 import subprocess
 import time
 import urllib.parse
@@ -8,8 +9,10 @@ from typing import Callable, Optional
 
 from obsidibear.bear_db import fetch_note_by_uuid, open_bear_db
 from obsidibear.config import Config
-from obsidibear.markdown import strip_frontmatter
-from obsidibear.sync_state import SyncStateManager, content_hash
+from obsidibear.markdown import strip_frontmatter_bytes
+from obsidibear.sync_state import (
+    SyncStateManager, content_hash, hash_vault_files, legacy_content_hash,
+)
 
 
 def push_changes(
@@ -32,6 +35,7 @@ def push_changes(
     state = SyncStateManager(vault)
 
     stats = {"pushed": 0, "conflicts": 0, "skipped": 0, "errors": []}
+    opener = _UrlOpener()
 
     try:
         # Build current hashes from Bear and Obsidian
@@ -39,17 +43,20 @@ def push_changes(
 
         notes = fetch_all_notes(conn)
         notes_by_id = {n.uuid: n for n in notes}
-        bear_hashes = {n.uuid: content_hash(n.text) for n in notes}
+        # Hashes were computed at fetch time; vault files hash in a pool
+        bear_hashes = {n.uuid: n.text_hash for n in notes}
+        obs_hashes = hash_vault_files(vault, state.all_notes())
 
-        obs_hashes = {}
-        for bear_id, ns in state.all_notes().items():
-            fp = vault / ns.file_path
-            if fp.exists():
-                obs_hashes[bear_id] = content_hash(
-                    fp.read_text(encoding="utf-8")
-                )
+        # One-time SHA-256 pass for pre-upgrade state entries, so edits
+        # pending at upgrade time are still detected (see legacy_ids)
+        legacy_hashes = None
+        if state.legacy_ids:
+            legacy_hashes = {
+                n.uuid: legacy_content_hash(n.text)
+                for n in notes if n.uuid in state.legacy_ids
+            }
 
-        changes = state.detect_changes(bear_hashes, obs_hashes)
+        changes = state.detect_changes(bear_hashes, obs_hashes, legacy_hashes)
 
         # Report conflicts
         for bid in changes.conflicts:
@@ -65,12 +72,16 @@ def push_changes(
                 continue
 
             fp = vault / ns.file_path
-            if not fp.exists():
+            # stat doubles as the existence check — one disk round trip
+            # instead of exists() plus stat()
+            try:
+                fp_stat = fp.stat()
+            except FileNotFoundError:
                 stats["errors"].append(f"File missing: {ns.file_path}")
                 continue
 
-            obsidian_content = fp.read_text(encoding="utf-8")
-            bear_content = strip_frontmatter(obsidian_content)
+            raw = fp.read_bytes()
+            bear_content = strip_frontmatter_bytes(raw).decode("utf-8")
 
             note = notes_by_id.get(bid)
             title = note.title if note else ns.file_path
@@ -82,26 +93,30 @@ def push_changes(
 
             try:
                 log(f"  Pushing: {title}")
-                _push_to_bear(bid, bear_content)
+                _push_to_bear(bid, bear_content, opener)
                 time.sleep(config.push_delay)
 
-                # Verify by re-reading from Bear
-                conn2 = open_bear_db(db_path)
-                try:
-                    updated = fetch_note_by_uuid(conn2, bid)
-                    if updated:
-                        new_bear_hash = content_hash(updated.text)
-                        state.set_note(
-                            bear_id=bid,
-                            file_path=ns.file_path,
-                            bear_hash=new_bear_hash,
-                            obsidian_hash=content_hash(obsidian_content),
-                        )
-                        stats["pushed"] += 1
-                    else:
-                        stats["errors"].append(f"Verify failed for: {title}")
-                finally:
-                    conn2.close()
+                # Verify by re-reading from Bear. The existing read-only
+                # connection sees Bear's committed write once its previous
+                # statement has finished, so no reopen is needed.
+                updated = fetch_note_by_uuid(conn, bid)
+                if updated:
+                    new_bear_hash = content_hash(updated.text)
+                    # Stamp the file we just read so the next run can
+                    # skip re-hashing it. hash_vault_files already
+                    # fingerprinted this file earlier in this run (that
+                    # is why it is in obsidian_changed), so reuse it
+                    state.set_note(
+                        bear_id=bid,
+                        file_path=ns.file_path,
+                        bear_hash=new_bear_hash,
+                        obsidian_hash=obs_hashes[bid],
+                        file_mtime_ns=fp_stat.st_mtime_ns,
+                        file_size=fp_stat.st_size,
+                    )
+                    stats["pushed"] += 1
+                else:
+                    stats["errors"].append(f"Verify failed for: {title}")
 
             except Exception as e:
                 stats["errors"].append(f"Push {title}: {e}")
@@ -111,15 +126,57 @@ def push_changes(
             f"{stats['conflicts']} conflicts")
 
     finally:
+        opener.close()
         conn.close()
 
     return stats
 
 
-def _push_to_bear(bear_id: str, content: str):
+class _UrlOpener:
+    """Feeds `open -g` commands to one long-lived shell.
+
+    A fresh subprocess.run per note costs a fork+exec (plus pipe setup)
+    each time, which dominates batched pushes. Writing one line per URL
+    to a persistent /bin/sh keeps the per-note cost at a pipe write.
+    Each command echoes its own exit status back on stdout so failures
+    (no bear:// handler, open(1) errors) raise here, like check=True
+    did, instead of being silently swallowed.
+    """
+
+    def __init__(self):
+        self._proc = None
+
+    def open_url(self, url: str):
+        if self._proc is None or self._proc.poll() is not None:
+            # stdout carries the per-command status lines; open(1)'s
+            # own chatter on stderr is noise we drop
+            self._proc = subprocess.Popen(
+                ["/bin/sh"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        self._proc.stdin.write(
+            f"open -g {shlex.quote(url)} && echo ok || echo fail\n"
+            .encode("ascii")
+        )
+        self._proc.stdin.flush()
+        status = self._proc.stdout.readline().strip()
+        if status != b"ok":
+            raise RuntimeError(f"open -g failed for URL: {url[:80]}...")
+
+    def close(self):
+        if self._proc is not None:
+            self._proc.stdin.close()
+            self._proc.wait()
+            self._proc = None
+
+
+def _push_to_bear(bear_id: str, content: str, opener: _UrlOpener):
     """Push content to Bear via x-callback-url.
 
-    Uses `open -g` to keep Bear in background.
+    Uses `open -g` (through the shared opener) to keep Bear in
+    background.
     """
     encoded_text = urllib.parse.quote(content, safe="")
     url = (
@@ -128,8 +185,4 @@ def _push_to_bear(bear_id: str, content: str):
         f"&mode=replace_all"
         f"&text={encoded_text}"
     )
-    subprocess.run(
-        ["open", "-g", url],
-        check=True,
-        capture_output=True,
-    )
+    opener.open_url(url)
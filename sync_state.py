@@ -1,22 +1,33 @@
 """Sync state tracking and change detection."""
 
+import bisect
 import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional
 
+try:
+    import orjson  # optional: C-accelerated, parses/emits bytes directly
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class NoteState:
     bear_id: str
     file_path: str  # Relative to vault root
     bear_hash: str
     obsidian_hash: str
+    # stat stamp of the file obsidian_hash was computed from; lets
+    # status/pull skip re-reading files whose mtime+size are unchanged
+    file_mtime_ns: int = 0
+    file_size: int = -1
 
 
-@dataclass
-class ChangeReport:
+class ChangeReport(NamedTuple):
     bear_changed: List[str]       # bear_ids with Bear-side changes
     obsidian_changed: List[str]   # bear_ids with Obsidian-side changes
     conflicts: List[str]          # bear_ids changed on both sides
@@ -24,9 +35,93 @@ class ChangeReport:
     deleted_in_bear: List[str]    # bear_ids removed from Bear
 
 
-def content_hash(text: str) -> str:
-    """SHA-256 hash of text content."""
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+# Hex length of a current-format fingerprint; pre-BLAKE2b state files
+# store 64-hex SHA-256 digests instead (see SyncStateManager._load)
+_HASH_HEX_LEN = 32
+
+
+def _new_hash():
+    # 128-bit BLAKE2b: faster than SHA-256 and plenty for change detection
+    return hashlib.blake2b(digest_size=16)
+
+
+def content_hash(text) -> str:
+    """Fingerprint of text content (128-bit BLAKE2b).
+
+    Accepts str or UTF-8 bytes; both hash identically.
+    """
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    return hashlib.blake2b(text, digest_size=16).hexdigest()
+
+
+def legacy_content_hash(text) -> str:
+    """SHA-256 fingerprint as written by pre-BLAKE2b state files.
+
+    Only used to compare entries in SyncStateManager.legacy_ids one
+    last time before they are rewritten in the current format.
+    """
+    if isinstance(text, str):
+        text = text.encode("utf-8")
+    return hashlib.sha256(text).hexdigest()
+
+
+def file_content_hash(path: Path) -> str:
+    """Fingerprint of a file's raw bytes, matching content_hash for UTF-8 text.
+
+    Uses hashlib.file_digest so the read+hash loop runs in C without
+    decoding the file to str first.
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, _new_hash).hexdigest()
+
+
+def hash_vault_files(
+    vault_path: Path,
+    note_states: Dict[str, "NoteState"],
+) -> Dict[str, str]:
+    """Hash all tracked vault files, returning bear_id -> fingerprint.
+
+    Pure disk reads + hashing with the GIL released, so a thread pool
+    overlaps I/O across files. Missing files are skipped.
+    """
+    def _one(item):
+        bear_id, ns = item
+        fp = vault_path / ns.file_path
+        try:
+            st = fp.stat()
+        except FileNotFoundError:
+            return bear_id, None
+        if len(ns.obsidian_hash) != _HASH_HEX_LEN:
+            # Pre-BLAKE2b entry: compare with the legacy algorithm one
+            # last time so an edit pending at upgrade time is still
+            # detected, and rewrite the stored hash in the current
+            # format when the file is unchanged
+            data = fp.read_bytes()
+            h = content_hash(data)
+            if hashlib.sha256(data).hexdigest() == ns.obsidian_hash:
+                ns.obsidian_hash = h
+                ns.file_mtime_ns = st.st_mtime_ns
+                ns.file_size = st.st_size
+            return bear_id, h
+        # statcache-style shortcut: unchanged stamp means unchanged file
+        if st.st_mtime_ns == ns.file_mtime_ns and st.st_size == ns.file_size:
+            return bear_id, ns.obsidian_hash
+        h = file_content_hash(fp)
+        if h == ns.obsidian_hash:
+            # Content still matches the recorded hash — stamp it so the
+            # next run can skip the read entirely
+            ns.file_mtime_ns = st.st_mtime_ns
+            ns.file_size = st.st_size
+        return bear_id, h
+
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return {
+            bid: h
+            for bid, h in ex.map(_one, note_states.items())
+            if h is not None
+        }
 
 
 class SyncStateManager:
@@ -36,21 +131,54 @@ class SyncStateManager:
         self.vault_path = vault_path
         self.state_file = vault_path / ".obsidibear_state.json"
         self._notes: Dict[str, NoteState] = {}
+        # Same NoteState objects, kept ordered by file_path so save()
+        # never re-sorts the whole vault
+        self._sorted: List[NoteState] = []
+        # bear_ids whose stored hashes predate the BLAKE2b format;
+        # detect_changes re-baselines these once instead of comparing
+        self._legacy_ids: set = set()
         self._load()
 
     def _load(self):
         """Load state from disk."""
         if not self.state_file.exists():
             return
-        data = json.loads(self.state_file.read_text(encoding="utf-8"))
+        raw = self.state_file.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         for entry in data.get("notes", []):
             state = NoteState(
                 bear_id=entry["bear_id"],
                 file_path=entry["file_path"],
                 bear_hash=entry["bear_hash"],
                 obsidian_hash=entry["obsidian_hash"],
+                file_mtime_ns=entry.get("file_mtime_ns", 0),
+                file_size=entry.get("file_size", -1),
             )
             self._notes[state.bear_id] = state
+        # One sort at load; set_note/remove_note maintain the order
+        self._sorted = sorted(
+            self._notes.values(), key=lambda s: s.file_path
+        )
+        # State files written before the BLAKE2b change store SHA-256
+        # digests, which can never match a current fingerprint; compared
+        # naively every note would surface as a conflict on every run.
+        # Flag them so detect_changes compares them with the legacy
+        # algorithm one last time (see legacy_ids) before rewriting.
+        self._legacy_ids = {
+            s.bear_id for s in self._notes.values()
+            if len(s.bear_hash) != _HASH_HEX_LEN
+        }
+
+    def _drop_sorted(self, state: NoteState):
+        """Remove one NoteState from the sorted list by identity."""
+        i = bisect.bisect_left(
+            self._sorted, state.file_path, key=lambda s: s.file_path
+        )
+        while i < len(self._sorted):
+            if self._sorted[i] is state:
+                del self._sorted[i]
+                return
+            i += 1
 
     def save(self):
         """Write state to disk."""
@@ -61,14 +189,23 @@ class SyncStateManager:
                     "file_path": s.file_path,
                     "bear_hash": s.bear_hash,
                     "obsidian_hash": s.obsidian_hash,
+                    "file_mtime_ns": s.file_mtime_ns,
+                    "file_size": s.file_size,
                 }
-                for s in sorted(self._notes.values(), key=lambda s: s.file_path)
+                for s in self._sorted
             ]
         }
-        self.state_file.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
+        if orjson:
+            self.state_file.write_bytes(orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+            ))
+        else:
+            # json.dump streams chunks to the file instead of building
+            # the whole document as one string first
+            with open(self.state_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write("\n")
 
     def set_note(
         self,
@@ -76,14 +213,34 @@ class SyncStateManager:
         file_path: str,
         bear_hash: str,
         obsidian_hash: str,
+        file_mtime_ns: int = 0,
+        file_size: int = -1,
     ):
         """Record or update state for a note."""
-        self._notes[bear_id] = NoteState(
+        old = self._notes.get(bear_id)
+        if old is not None:
+            self._drop_sorted(old)
+        state = NoteState(
             bear_id=bear_id,
             file_path=file_path,
             bear_hash=bear_hash,
             obsidian_hash=obsidian_hash,
+            file_mtime_ns=file_mtime_ns,
+            file_size=file_size,
         )
+        self._notes[bear_id] = state
+        bisect.insort(self._sorted, state, key=lambda s: s.file_path)
+        self._legacy_ids.discard(bear_id)
+
+    @property
+    def legacy_ids(self) -> set:
+        """bear_ids whose stored hashes predate the BLAKE2b format.
+
+        Callers pass legacy_content_hash of these notes' current text
+        to detect_changes so the one-time migration can still see
+        edits made before the upgrade.
+        """
+        return self._legacy_ids
 
     def get_note(self, bear_id: str) -> Optional[NoteState]:
         """Get stored state for a note."""
@@ -95,18 +252,24 @@ class SyncStateManager:
 
     def remove_note(self, bear_id: str):
         """Remove a note from tracking."""
-        self._notes.pop(bear_id, None)
+        state = self._notes.pop(bear_id, None)
+        if state is not None:
+            self._drop_sorted(state)
 
     def detect_changes(
         self,
         bear_notes: Dict[str, str],  # bear_id -> bear content hash
         obsidian_files: Dict[str, str],  # bear_id -> obsidian content hash
+        legacy_bear_hashes: Optional[Dict[str, str]] = None,
     ) -> ChangeReport:
         """Compare current state against Bear DB and vault files.
 
         Args:
             bear_notes: Current Bear content hashes by bear_id.
             obsidian_files: Current Obsidian file content hashes by bear_id.
+            legacy_bear_hashes: legacy_content_hash of the current note
+                text for every id in legacy_ids, so pre-upgrade state
+                entries compare correctly one last time.
 
         Returns:
             ChangeReport describing all detected changes.
@@ -114,35 +277,61 @@ class SyncStateManager:
         bear_changed = []
         obsidian_changed = []
         conflicts = []
-        new_in_bear = []
         deleted_in_bear = []
 
-        all_bear_ids = set(bear_notes.keys())
-        all_tracked_ids = set(self._notes.keys())
-
-        # New notes in Bear (not yet tracked)
-        for bid in all_bear_ids - all_tracked_ids:
-            new_in_bear.append(bid)
-
-        # Deleted from Bear (tracked but no longer in Bear)
-        for bid in all_tracked_ids - all_bear_ids:
-            deleted_in_bear.append(bid)
+        # New notes in Bear (not yet tracked) — dict keys views diff in C
+        new_in_bear = list(bear_notes.keys() - self._notes.keys())
 
-        # Check tracked notes for changes
-        for bid in all_tracked_ids & all_bear_ids:
-            state = self._notes[bid]
-            current_bear_hash = bear_notes[bid]
-            current_obs_hash = obsidian_files.get(bid, state.obsidian_hash)
+        # One pass over tracked notes classifies deleted/changed/conflict.
+        # Bound methods (.get, .append) become LOAD_FAST + CALL in the
+        # loop body, so every per-note operation runs at C level with no
+        # attribute lookups left in the hot path.
+        get_bear = bear_notes.get
+        get_obs = obsidian_files.get
+        add_deleted = deleted_in_bear.append
+        add_conflict = conflicts.append
+        add_bear = bear_changed.append
+        add_obs = obsidian_changed.append
+        legacy = self._legacy_ids
+        for bid, state in self._notes.items():
+            current_bear_hash = get_bear(bid)
+            if current_bear_hash is None:
+                # Deleted from Bear (tracked but no longer in Bear)
+                add_deleted(bid)
+                continue
+            stored_obs = state.obsidian_hash
+            current_obs_hash = get_obs(bid, stored_obs)
+            obs_diff = current_obs_hash != stored_obs
 
-            bear_diff = current_bear_hash != state.bear_hash
-            obs_diff = current_obs_hash != state.obsidian_hash
+            if legacy and bid in legacy:
+                # Pre-BLAKE2b entry. The vault side was already
+                # re-compared (and migrated) by hash_vault_files; the
+                # Bear side compares the caller's legacy hash of the
+                # current text against the stored digest. Without a
+                # legacy hash the note counts as Bear-changed, so it
+                # is refreshed by a pull rather than silently adopted.
+                old_bear = (
+                    legacy_bear_hashes.get(bid)
+                    if legacy_bear_hashes else None
+                )
+                bear_diff = old_bear != state.bear_hash
+                if not bear_diff:
+                    # Unchanged under the old algorithm: store the
+                    # current-format hash; the save() after the sync
+                    # persists it
+                    state.bear_hash = current_bear_hash
+                if (len(state.bear_hash) == _HASH_HEX_LEN
+                        and len(state.obsidian_hash) == _HASH_HEX_LEN):
+                    legacy.discard(bid)
+            else:
+                bear_diff = current_bear_hash != state.bear_hash
 
             if bear_diff and obs_diff:
-                conflicts.append(bid)
+                add_conflict(bid)
             elif bear_diff:
-                bear_changed.append(bid)
+                add_bear(bid)
             elif obs_diff:
-                obsidian_changed.append(bid)
+                add_obs(bid)
 
         return ChangeReport(
             bear_changed=sorted(bear_changed),